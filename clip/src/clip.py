@@ -1,8 +1,102 @@
 import os 
-import json 
+import orjson
+import io
+import time
+import logging
+import functools
+import threading
+import weakref
+import asyncio
+import itertools
+import email.utils
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests 
 import pandas as pd 
-from datetime import datetime, timedelta 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+from typing import Union
+
+logger = logging.getLogger("clip")
+
+# Only advertise brotli when it can be decoded, requests and aiohttp fall back to gzip/deflate without it
+try:
+    import brotli
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# pyarrow is only needed for convert="arrow"
+try:
+    import pyarrow as pa
+    import pyarrow.json as paj
+except ImportError:
+    pa = None
+
+# Connections kept per host, which also bounds how many batch_lookup chunks can be in flight at once
+POOL_MAXSIZE = 64
+
+# Transient failures worth retrying, shared by the requests session and lookup_many
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = (429, 502, 503, 504)
+
+
+def _retry_after(
+    value: str,
+    default: float
+):
+    '''
+        Returns the delay in seconds requested by a Retry-After header, given either as seconds or as an HTTP 
+        date, or `default` when the header is missing or cannot be read.
+    '''
+    if not value:
+        return default
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return default
+
+# How far ahead of expiry the background thread refreshes the token, and how long it backs off after failures
+REFRESH_LEAD = 30
+REFRESH_LEAD_FRACTION = 0.25
+REFRESH_BACKOFF_MAX = 300
+
+# lookup argument names and the CLIP API parameter names they are sent as
+PARAMETER_NAMES = {
+    "legacy_county_source": "legacyCountySource",
+    "best_match": "bestMatch",
+    "google_fallback": "googleFallback",
+    "apn": "apn",
+    "address": "address",
+    "city": "city",
+    "state": "state",
+    "zip_code": "zipCode",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "owners": "owners",
+    "clip": "clip",
+}
+
+class _LookupKey(tuple):
+    '''
+        A lookup cache key. It hashes and compares as the tuple of normalized (name, value) parameters, while 
+        `params` keeps the parameters as the caller passed them so those are what gets sent.
+    '''
+    def __new__(
+        cls,
+        key: tuple,
+        params: tuple
+    ):
+        instance = super().__new__(cls, key)
+        instance.params = params
+        return instance
+
 
 class Clip:
     def __init__(
@@ -10,7 +104,11 @@ class Clip:
         token_credentials: str = None,
         authorization_url: str = 'https://api-uat.corelogic.com/edgemicro-auth-clip/token?grant_type=client_credentials',
         clip_lookup_url: str = 'https://clip-lookup-uat.solutions.corelogic.com',
-        clip_batch_url: str = 'https://clip-batch-uat.solutions.corelogic.com'
+        clip_batch_url: str = 'https://clip-batch-uat.solutions.corelogic.com',
+        persist_env: bool = True,
+        schema: dict = None,
+        timeout: float = 10,
+        batch_timeout: float = 300
     ):
         '''
             Initializes an instance of the Clip class.
@@ -20,6 +118,15 @@ class Clip:
                 authorization_url (str): The URL for obtaining the bearer token. Default is the UAT authorization URL.
                 clip_lookup_url (str): The URL for the CLIP lookup service. Default is the UAT lookup URL.
                 clip_batch_url (str): The URL for the CLIP batch service. Default is the UAT batch URL.
+                persist_env (bool): Whether to share the bearer token with other instances and child processes 
+                    through environment variables. Default is True.
+                schema (dict): A mapping of CLIP response column names to pandas dtypes used when converting 
+                    responses to DataFrames. Default is None, in which case the columns are learned from the 
+                    first flat response and dtypes are inferred.
+                timeout (float): The connect and read timeout in seconds for every request, so a stalled 
+                    connection cannot hang a batch indefinitely. Default is 10.
+                batch_timeout (float): The read timeout in seconds for each batch_lookup chunk, which the server 
+                    may take far longer to answer than a single lookup. Default is 300.
         '''
         self.bearer_token = os.getenv("__bearerToken")
         self.expires_in_time = os.getenv("__expiresInTime")
@@ -28,10 +135,101 @@ class Clip:
         self.clip_lookup_url = os.environ.get("clipLookupUrl", clip_lookup_url)
         self.token_credentials = os.environ.get("tokenCredentials", token_credentials)
         self.authorization_url = os.environ.get("authorizationUrl", authorization_url)
+        self.persist_env = persist_env
+        self.timeout = timeout
+        self.batch_timeout = batch_timeout
+        self._schema_columns = list(schema) if schema else None
+        self._dtypes = schema
+
+        # Columns learned from the first flat response of each endpoint, used when no schema is given
+        self._columns = {}
 
         # Set a default value for expires_in_time if it is None
         if self.expires_in_time is None:
             self.expires_in_time = 300000
+        self.expires_in_time = int(self.expires_in_time)
+
+        # Translate a token shared through the environment into a monotonic deadline so get_bearer_token 
+        # only has to compare two floats and is unaffected by wall-clock jumps
+        if self.bearer_token and self.token_timestamp:
+            token_age = (datetime.now() - datetime.fromisoformat(self.token_timestamp)).total_seconds()
+            self._token_deadline = time.monotonic() + self.expires_in_time / 1000.0 - token_age
+        else:
+            self._token_deadline = float("-inf")
+
+        # Refresh the token ahead of expiry on a background thread, started on first use
+        self._token_lock = threading.Lock()
+        self._refresh_thread = None
+        self._stopping = threading.Event()
+
+        # Memoize identical lookups per instance rather than on the class, so the cache does not keep instances alive
+        self._lookup_raw = functools.lru_cache(maxsize=100_000)(self._lookup_raw)
+
+        # Keep one session for the lifetime of the instance so repeated calls reuse keep-alive connections
+        self.session = requests.Session()
+        # Retry transient failures at the connection level so a single 5xx does not fail a whole batch
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=("GET", "POST"),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+
+        # A read error on a batch POST means the server may already have processed the whole chunk, so don't 
+        # resend it, only retry on connection failures and the retryable statuses
+        batch_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=retry.new(read=False))
+        self.session.mount(self.clip_batch_url, batch_adapter)
+
+        # Proxy and certificate settings for the lookup host, resolved once since session.send skips them
+        self._search_url = f"{self.clip_lookup_url}/search"
+        self._search_settings = self.session.merge_environment_settings(self._search_url, {}, None, None, None)
+        self._set_auth_header()
+
+
+    def _set_auth_header(
+        self
+    ):
+        '''
+            Description:
+                Rebuilds the headers that depend on the bearer token, along with the prepared lookup request 
+                that carries them, so the per-call work in lookup is limited to encoding the query string.
+
+            Parameters:
+                self: The instance of the Clip class.
+        '''
+        self._auth_header = {"Authorization": f"Bearer {self.bearer_token}", "Accept-Encoding": ACCEPT_ENCODING}
+        self._search_request = self.session.prepare_request(
+            requests.Request("GET", self._search_url, headers=self._auth_header)
+        )
+
+
+    def close(
+        self
+    ):
+        '''
+            Stops the background token refresher and closes the underlying HTTP session, releasing its 
+            pooled connections.
+        '''
+        self._stopping.set()
+        self.session.close()
+
+
+    def __enter__(
+        self
+    ):
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type,
+        exc_value,
+        traceback
+    ):
+        self.close()
 
 
     def _refresh_token(
@@ -41,14 +239,15 @@ class Clip:
             Description:
                 This function is responsible for refreshing the token used for authorization in the Clip class. 
                 It sends a POST request to the authorization URL provided and updates the necessary token-related 
-                information in the environment variables and instance variables.
+                information in the instance variables, and in the environment variables when persist_env is set.
 
             Parameters:
                 self: The instance of the Clip class.
 
             Exceptions:
-                If there is an error while refreshing the token or accessing the authorization URL, an exception 
-                is raised and an error message is printed.
+                requests.RequestException: If the authorization URL cannot be reached or returns an error status 
+                    after retries.
+                ValueError: If the response is not JSON or does not include an access_token.
             
             Return Value:
                 This function does not return any value.
@@ -57,34 +256,37 @@ class Clip:
                 You do not need to call this function directly. It is automatically invoked by other methods in 
                 the Clip class when the token has expired or needs refreshing.
         '''
-        try:
-            response = requests.post(
-                self.authorization_url, 
-                headers = {
-                    "Accept": "*/*",
-                    "Content-Type": "application/json",
-                    "Authorization": self.token_credentials
-                }
-            )
+        response = self.session.post(
+            self.authorization_url, 
+            headers = {
+                "Accept": "*/*",
+                "Content-Type": "application/json",
+                "Authorization": self.token_credentials
+            },
+            timeout = self.timeout
+        )
+        response.raise_for_status()
 
-        except Exception as e:
-            print(f"ERROR: Refreshing token, verify the host name '{self.authorization_url}' and port 443 are correct and accessible: {e}")
-        
-        try:
-            response_json = response.json()
+        response_json = orjson.loads(response.content)
+        token_time = time.monotonic()
 
-            # Update the environment variables with the new token information
-            os.environ["__bearerToken"] = response_json.get("access_token")
-            os.environ["__tokenTimestamp"] = datetime.now().isoformat()
+        if not response_json.get("access_token"):
+            raise ValueError(f"Token response from '{self.authorization_url}' did not include an access_token")
 
-            if response_json.get("expires_in"):
-                self.expires_in_time = response_json.get("expires_in") * 1000
+        self.bearer_token = response_json["access_token"]
+        self._set_auth_header()
+        self.token_timestamp = datetime.now().isoformat()
 
-            os.environ["__expiresInTime"] = str(self.expires_in_time)
-            self.bearer_token = os.getenv("__bearerToken")
-        except Exception as e:
-            print(f"ERROR: Configuring internal parameters, ensure the proper libraries are installed.: {e}")
+        if response_json.get("expires_in"):
+            self.expires_in_time = int(response_json.get("expires_in") * 1000)
 
+        self._token_deadline = token_time + self.expires_in_time / 1000.0
+
+        # Update the environment variables with the new token information
+        if self.persist_env:
+            os.environ["__bearerToken"] = self.bearer_token
+            os.environ["__tokenTimestamp"] = self.token_timestamp
+            os.environ["__expiresInTime"] = str(self.expires_in_time)
 
 
     def get_bearer_token(
@@ -93,25 +295,159 @@ class Clip:
         '''
             Retrieves the bearer token for authentication.
 
+            Refreshes the token first if it has expired, and on first use starts a background thread that 
+            keeps refreshing it shortly before it expires so later calls never wait on the authorization URL.
+
             Returns:
                 str: The bearer token for authentication.
+        '''
+        # Check if the current token has expired or needs refreshing, only one caller refreshes at a time
+        if time.monotonic() >= self._token_deadline:
+            with self._token_lock:
+                if time.monotonic() >= self._token_deadline:
+                    self._refresh_token()
 
-            Raises:
-                Exception: If there is an error comparing existing bearer token parameters.
+        if self._refresh_thread is None:
+            with self._token_lock:
+                if self._refresh_thread is None:
+                    # The thread only holds a weak reference, and is stopped once this instance is collected, so 
+                    # instances that are never closed do not leak a refresher each
+                    self._refresh_thread = threading.Thread(
+                        target=Clip._refresh_loop,
+                        args=(weakref.ref(self), self._stopping),
+                        name="clip-token-refresh",
+                        daemon=True
+                    )
+                    weakref.finalize(self, self._stopping.set)
+                    self._refresh_thread.start()
+
+        return self.bearer_token
+
+
+    @staticmethod
+    def _refresh_loop(
+        client_ref: weakref.ref,
+        stopping: threading.Event
+    ):
+        '''
+            Description:
+                Runs on the background refresher thread until close is called or the instance is collected, 
+                refreshing the token 30 seconds before it expires, or a quarter of its lifetime before for 
+                short-lived tokens. Failed refreshes are retried with exponential backoff.
+
+            Parameters:
+                client_ref: A weak reference to the instance of the Clip class.
+                stopping: The instance's stop event, set by close or when the instance is collected.
         '''
-        try:
-            # Check if the current token has expired or needs refreshing
-            if self.token_timestamp:
-                token_date = datetime.fromisoformat(self.token_timestamp)
+        failures = 0
+        while True:
+            client = client_ref()
+            if client is None:
+                return
+            lead = min(REFRESH_LEAD, client.expires_in_time / 1000.0 * REFRESH_LEAD_FRACTION)
+            if failures:
+                wait = min(2 ** failures, REFRESH_BACKOFF_MAX)
             else:
-                token_date = datetime(2010, 1, 1)
+                wait = max(client._token_deadline - time.monotonic() - lead, 0)
+            del client
+
+            if stopping.wait(wait):
+                return
+
+            client = client_ref()
+            if client is None:
+                return
+            try:
+                with client._token_lock:
+                    if time.monotonic() >= client._token_deadline - lead:
+                        client._refresh_token()
+                failures = 0
+            except Exception:
+                failures += 1
+                logger.exception("Refreshing token in the background, verify the host name '%s' and port 443 are correct and accessible", client.authorization_url)
+            del client
 
-            if datetime.now() - token_date >= timedelta(milliseconds=int(self.expires_in_time)):
-                self._refresh_token()
 
-            return self.bearer_token
-        except Exception as e:
-            print(f"ERROR: Failed comparing existing Bearer Token parameters: {e}")
+    def _to_frame(
+        self,
+        records: list[dict],
+        endpoint: str
+    ):
+        '''
+            Description:
+                Converts a list of CLIP response records to a DataFrame. Once the columns are known, either from 
+                the schema passed to __init__ or learned from an earlier response of the same endpoint, the 
+                records are loaded with `from_records` against that fixed column list instead of being 
+                normalized and re-inferred. Learned columns are only used while every record fits within them.
+
+            Parameters:
+                self: The instance of the Clip class.
+                records: The "data" records from one or more CLIP responses.
+                endpoint: The endpoint the records came from, "search" or "batch", since their responses 
+                    need not share columns.
+
+            Returns:
+                A DataFrame with one row per record.
+        '''
+        columns = self._schema_columns or self._columns.get(endpoint)
+
+        # A learned column list only covers the fields seen so far, fall back to normalizing when a record 
+        # carries a field outside it rather than silently dropping that field
+        if columns and not self._schema_columns:
+            known = set(columns)
+            if not all(known.issuperset(record) for record in records):
+                columns = None
+
+        if columns:
+            df = pd.DataFrame.from_records(records, columns=columns)
+        else:
+            df = pd.json_normalize(records, max_level=1)
+
+            # Only learn the columns of flat responses, from_records cannot expand nested fields
+            if len(df.columns) and not any("." in column for column in df.columns):
+                self._columns[endpoint] = list(df.columns)
+
+        if self._dtypes:
+            df = df.astype(self._dtypes, copy=False)
+
+        return df
+
+
+    @staticmethod
+    def _require_arrow(
+        convert: Union[bool, str]
+    ):
+        '''
+            Raises ImportError when convert is "arrow" and pyarrow is not installed, so the lookup methods can 
+            fail before sending any request rather than after.
+        '''
+        if convert == "arrow" and pa is None:
+            raise ImportError("pyarrow is required for convert='arrow', install it with `pip install clip[arrow]`")
+
+
+    def _to_arrow(
+        self,
+        records: list[dict]
+    ):
+        '''
+            Description:
+                Converts a list of CLIP response records to a pyarrow Table without going through pandas. The 
+                table can be handed to DuckDB or Polars without a copy, e.g. `duckdb.sql("SELECT * FROM table")`.
+
+            Parameters:
+                self: The instance of the Clip class.
+                records: The "data" records from one or more CLIP responses.
+
+            Returns:
+                A pyarrow Table with one row per record.
+        '''
+        self._require_arrow("arrow")
+
+        if not records:
+            return pa.table({})
+
+        # pyarrow's JSON reader expects newline-delimited records
+        return paj.read_json(io.BytesIO(b"\n".join(orjson.dumps(record) for record in records)))
 
 
     def lookup(
@@ -128,12 +464,18 @@ class Clip:
         longitude: str = None, 
         owners: str = None,
         clip: str = None,
-        convert: bool = True,
+        convert: Union[bool, str] = True,
     ):
         '''
             Description:
                 This method is used to perform a lookup in the CLIP (CoreLogic Integrator Portal) API. It sends a 
-                GET request to the CLIP lookup endpoint with the specified parameters and returns the response.
+                GET request to the CLIP lookup endpoint with the specified parameters and returns the response. 
+                Repeated lookups with the same parameters are answered from a per-instance cache, see 
+                `cache_info` and `cache_clear`. Lookups differing only in the case or surrounding whitespace 
+                of address and state, or in a ZIP+4 suffix, share a cache entry. Parameters are always sent 
+                as given.
+                For more than a handful of addresses use `batch_lookup` instead, which resolves many rows per 
+                request.
 
             Parameters:
                 self: The instance of the Clip class.
@@ -149,11 +491,16 @@ class Clip:
                 longitude (optional): A string representing the longitude.
                 owners (optional): A string representing the owners.
                 clip (optional): A string representing the CLIP value.
-                convert (optional): A boolean indicating whether to convert the CLIP response to a DataFrame. 
-                    Default is True.
+                convert (optional): A boolean indicating whether to convert the CLIP response to a DataFrame, 
+                    or "arrow" to convert it to a pyarrow Table. Default is True.
 
             Returns:
-                The function returns the CLIP response as either a DataFrame (if convert is True) or a JSON object.
+                The function returns the CLIP response as either a DataFrame (if convert is True), a pyarrow 
+                Table (if convert is "arrow") or a JSON object.
+
+            Raises:
+                ValueError: If none of apn, address, latitude and longitude, or clip are provided (blank strings 
+                    count as missing), since such a lookup can never match.
 
             Example:
                 # Create an instance of the Clip class and perform a lookup
@@ -173,35 +520,391 @@ class Clip:
                     convert=True
                 )   
         '''
-        # Send the GET request
-        try:
-            response = requests.get(
-                url = f"{self.clip_lookup_url}/search", 
-                headers = {
-                    "Authorization": f"Bearer {self.get_bearer_token()}"
-                }, 
-                params = {
-                    "legacyCountySource": legacy_county_source,
-                    "bestMatch": best_match,
-                    "googleFallback": google_fallback,
-                    "apn": apn,
-                    "address": address,
-                    "city": city,
-                    "state": state,
-                    "zipCode": zip_code,
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "owners": owners,
-                    "clip": clip,
-                }
+        self._require_arrow(convert)
+
+        # Skip the round-trip for lookups that cannot match anything
+        present = {
+            name: value is not None and not (isinstance(value, str) and not value.strip()) and not pd.isna(value)
+            for name, value in (
+                ("apn", apn),
+                ("address", address),
+                ("clip", clip),
+                ("latitude", latitude),
+                ("longitude", longitude),
             )
-        except Exception as e:
-            print(f"ERROR: GET request failed, verify the host name '{self.clip_lookup_url}' and port 443 are correct and accessible: {e}")
-        
+        }
+        if not self._identifies(present):
+            raise ValueError("lookup requires at least one of apn/address/lat+lon/clip")
+
+        # Only send the parameters that were provided, exactly as given
+        params = tuple(
+            (key, value) for key, value in (
+                ("legacyCountySource", legacy_county_source),
+                ("bestMatch", best_match),
+                ("googleFallback", google_fallback),
+                ("apn", apn),
+                ("address", address),
+                ("city", city),
+                ("state", state),
+                ("zipCode", zip_code),
+                ("latitude", latitude),
+                ("longitude", longitude),
+                ("owners", owners),
+                ("clip", clip),
+            ) if value is not None
+        )
+
+        # Normalize the fields that commonly differ only in formatting so duplicate lookups share a cache entry, 
+        # the normalized values only make up the key and are never sent
+        if isinstance(address, str):
+            address = address.strip().upper()
+        if isinstance(state, str):
+            state = state.strip().upper()
+        if zip_code:
+            zip_code = str(zip_code).strip()[:5]
+        key = tuple(
+            (name, {"address": address, "state": state, "zipCode": zip_code}.get(name, value))
+            for name, value in params
+        )
+
+        content = self._lookup_raw(_LookupKey(key, params))
+
         if convert:
-            try:
-                return pd.DataFrame(response.json()['data'])
-            except Exception as e:
-                print(f"ERROR: Converting CLIP response to dataframe: {e}")
+            records = orjson.loads(content)['data']
+            return self._to_arrow(records) if convert == "arrow" else self._to_frame(records, "search")
         else: 
-            return response.json()
+            return orjson.loads(content)
+
+
+    def _lookup_raw(
+        self,
+        key: "_LookupKey"
+    ):
+        '''
+            Description:
+                Sends the GET request for lookup and returns the raw response body. Calls are memoized on the 
+                instance keyed on the normalized parameters, and the body is returned as immutable bytes so 
+                every caller decodes its own copy.
+
+            Parameters:
+                self: The instance of the Clip class.
+                key: The normalized parameters, carrying the parameters to send as given by the caller.
+
+            Returns:
+                bytes: The response body.
+        '''
+        # Send the GET request from the prepared template, only the query string changes between calls
+        self.get_bearer_token()
+        prepared = self._search_request.copy()
+        prepared.prepare_url(self._search_url, key.params)
+        response = self.session.send(prepared, timeout=self.timeout, **self._search_settings)
+        response.raise_for_status()
+
+        return response.content
+
+
+    def cache_info(
+        self
+    ):
+        '''
+            Returns the hit/miss statistics of the lookup cache.
+        '''
+        return self._lookup_raw.cache_info()
+
+
+    def cache_clear(
+        self
+    ):
+        '''
+            Empties the lookup cache.
+        '''
+        self._lookup_raw.cache_clear()
+
+
+    async def lookup_many(
+        self, 
+        rows: list[dict], 
+        concurrency: int = 64, 
+        convert: Union[bool, str] = True,
+    ):
+        '''
+            Description:
+                This method performs many lookups against the CLIP lookup endpoint concurrently. Each row is 
+                sent as its own GET request, but up to `concurrency` requests are kept in flight at once over 
+                a single aiohttp session so the round-trips overlap instead of running one after another.
+
+            Parameters:
+                self: The instance of the Clip class.
+                rows: A list of dictionaries, each holding the query parameters for one lookup using the CLIP 
+                    API names (e.g. "address", "city", "state", "zipCode"). Keys with a value of None are dropped.
+                concurrency (optional): The maximum number of requests in flight at once. Default is 64.
+                convert (optional): A boolean indicating whether to combine the CLIP responses into a single 
+                    DataFrame, or "arrow" to combine them into a single pyarrow Table. Default is True.
+
+            Returns:
+                The function returns the combined CLIP responses as a DataFrame (if convert is True), a pyarrow 
+                Table (if convert is "arrow") or a list with one JSON object per row, in the same order as `rows`. 
+                Rows whose request failed are logged and left out of the combined result, or returned as the 
+                raised exception when convert is False.
+
+            Example:
+                # Create an instance of the Clip class and perform several lookups at once
+                await Clip().lookup_many(
+                    rows=[
+                        {"address": "501 Auburn Avenue NE", "city": "Atlanta", "state": "GA", "zipCode": "30312"},
+                        {"address": "40 Pacifica", "city": "Irvine", "state": "CA", "zipCode": "92618"},
+                    ],
+                    concurrency=64,
+                    convert=True
+                )
+        '''
+        self._require_arrow(convert)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with aiohttp.ClientSession(
+            connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60),
+            timeout = aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+        ) as session:
+
+            async def fetch(row):
+                params = {key: str(value) for key, value in row.items() if value is not None}
+                async with semaphore:
+                    # aiohttp has no built-in retries, so mirror the requests session: back off on connection 
+                    # errors, timeouts and the retryable statuses, honouring Retry-After on the latter
+                    for attempt in range(RETRY_TOTAL + 1):
+                        delay = RETRY_BACKOFF_FACTOR * 2 ** attempt
+                        try:
+                            # Read the headers per request, a run can outlive the token the session started with
+                            self.get_bearer_token()
+                            async with session.get(self._search_url, params=params, headers=self._auth_header) as response:
+                                if attempt < RETRY_TOTAL and response.status in RETRY_STATUS_FORCELIST:
+                                    delay = _retry_after(response.headers.get("Retry-After"), delay)
+                                else:
+                                    response.raise_for_status()
+                                    return await response.json(loads=orjson.loads, content_type=None)
+                        except aiohttp.ClientResponseError:
+                            raise
+                        except (aiohttp.ClientError, asyncio.TimeoutError):
+                            if attempt == RETRY_TOTAL:
+                                raise
+                        await asyncio.sleep(delay)
+
+            results = await asyncio.gather(*(fetch(row) for row in rows), return_exceptions=True)
+
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "GET request for row %s failed, verify the host name '%s' and port 443 are correct and accessible",
+                    index, self.clip_lookup_url, exc_info=result
+                )
+
+        if convert:
+            records = list(itertools.chain.from_iterable(
+                result['data'] for result in results if not isinstance(result, Exception)
+            ))
+            return self._to_arrow(records) if convert == "arrow" else self._to_frame(records, "search")
+        else:
+            return results
+
+
+    def lookup_many_sync(
+        self, 
+        rows: list[dict], 
+        concurrency: int = 64, 
+        convert: Union[bool, str] = True,
+    ):
+        '''
+            Description:
+                A blocking wrapper around `lookup_many` for callers that are not running an event loop.
+
+            Parameters:
+                self: The instance of the Clip class.
+                rows: A list of dictionaries, each holding the query parameters for one lookup.
+                concurrency (optional): The maximum number of requests in flight at once. Default is 64.
+                convert (optional): A boolean indicating whether to combine the CLIP responses into a single 
+                    DataFrame, or "arrow" to combine them into a single pyarrow Table. Default is True.
+
+            Returns:
+                The same value as `lookup_many`.
+        '''
+        return asyncio.run(self.lookup_many(rows, concurrency=concurrency, convert=convert))
+
+
+    @staticmethod
+    def _identifies(
+        present
+    ):
+        '''
+            Description:
+                The rule shared by lookup and batch_lookup for whether a lookup can match a parcel: an apn, an 
+                address, a clip, or both a latitude and a longitude must be present.
+
+            Parameters:
+                present: A mapping from "apn", "address", "clip", "latitude" and "longitude" to whether each is 
+                    present, as booleans for a single lookup or boolean Series for a DataFrame.
+
+            Returns:
+                A boolean, or a boolean Series for a DataFrame.
+        '''
+        return present["apn"] | present["address"] | present["clip"] | (present["latitude"] & present["longitude"])
+
+
+    @staticmethod
+    def _identifiable(
+        df: pd.DataFrame
+    ):
+        '''
+            Description:
+                Flags the rows of a batch_lookup DataFrame that carry enough information to match a parcel, 
+                using the same rule as lookup. Missing values and blank strings count as missing, zero does not.
+
+            Parameters:
+                df: The DataFrame passed to batch_lookup.
+
+            Returns:
+                A boolean Series aligned with df.
+        '''
+        frame = df.reindex(columns=["apn", "address", "clip", "latitude", "longitude"])
+        blank = frame.apply(lambda column: column.astype("string").str.strip().eq("").fillna(False).astype(bool))
+        return Clip._identifies(frame.notna() & ~blank)
+
+
+    def _post_chunk(
+        self,
+        chunk: pd.DataFrame
+    ):
+        '''
+            Description:
+                Sends one chunk of a batch_lookup to the CLIP batch endpoint and returns the decoded response.
+
+            Parameters:
+                self: The instance of the Clip class.
+                chunk: The rows to look up.
+        '''
+        # Send the POST request, decoding the compressed body once and releasing the connection straight after
+        self.get_bearer_token()
+        with self.session.post(
+            url = f"{self.clip_batch_url}/batch", 
+            headers = self._auth_header, 
+            json = chunk.to_dict(orient="records"),
+            stream = True,
+            timeout = (self.timeout, self.batch_timeout)
+        ) as response:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+
+    @staticmethod
+    def prepare(
+        df: pd.DataFrame
+    ):
+        '''
+            Description:
+                Converts a DataFrame of lookup inputs into the form expected by batch_lookup and lookup_many. 
+                Columns named like the lookup arguments are renamed to the CLIP API parameter names and 
+                normalized with the rules lookup uses for its cache key (address and state stripped and 
+                upper-cased, ZIP codes cut to 5 digits, numeric ZIP codes zero-padded), using vectorized string 
+                operations over whole columns instead of per-row Python.
+
+            Parameters:
+                df: A DataFrame whose columns are lookup argument names (e.g. "address", "city", "state", 
+                    "zip_code"). Other columns are ignored.
+
+            Returns:
+                A DataFrame with the CLIP API parameter names as columns and None for missing values.
+
+            Example:
+                # Normalize a DataFrame of addresses and look them all up in bulk
+                client = Clip()
+                client.batch_lookup(client.prepare(df))
+
+                # Or send them one request per row
+                client.lookup_many_sync(client.prepare(df).to_dict(orient="records"))
+        '''
+        out = pd.DataFrame(
+            {name: df[column] for column, name in PARAMETER_NAMES.items() if column in df.columns},
+            index=df.index
+        )
+
+        for name in ("address", "state"):
+            if name in out.columns:
+                out[name] = out[name].astype("string").str.strip().str.upper()
+        if "zipCode" in out.columns:
+            # Numeric ZIP columns (floats whenever the CSV had a blank) lose their leading zeros, restore them
+            if pd.api.types.is_numeric_dtype(out["zipCode"]):
+                out["zipCode"] = pd.to_numeric(out["zipCode"]).round().astype("Int64").astype("string").str.zfill(5)
+            out["zipCode"] = out["zipCode"].astype("string").str.strip().str[:5]
+
+        # None rather than NaN/NA, so the records serialize to JSON and are dropped from query strings
+        return out.astype(object).where(out.notna(), None)
+
+
+    def batch_lookup(
+        self, 
+        df: pd.DataFrame, 
+        batch_size: int = 10_000, 
+        workers: int = 8,
+        convert: Union[bool, str] = True,
+    ):
+        '''
+            Description:
+                This method performs a bulk lookup using the CLIP batch endpoint. The DataFrame is split into 
+                chunks of `batch_size` rows and each chunk is sent as a single POST request, so the per-request 
+                overhead is paid once per chunk rather than once per row. Up to `workers` chunks are sent at 
+                the same time over the shared session.
+
+            Parameters:
+                self: The instance of the Clip class.
+                df: A DataFrame with one row per lookup, whose columns are the CLIP API parameter names 
+                    (e.g. "address", "city", "state", "zipCode"). Rows without an apn, address, latitude and 
+                    longitude, or clip are dropped before sending.
+                batch_size (optional): The number of rows sent per request. Default is 10,000.
+                workers (optional): The number of chunks in flight at once, capped at the connection pool size 
+                    (64). Default is 8.
+                convert (optional): A boolean indicating whether to combine the CLIP responses into a single 
+                    DataFrame, or "arrow" to combine them into a single pyarrow Table. Default is True.
+
+            Returns:
+                The function returns the combined CLIP responses as a DataFrame (if convert is True), a pyarrow 
+                Table (if convert is "arrow") or a list with one JSON object per chunk.
+
+            Example:
+                # Create an instance of the Clip class and look up every row of a DataFrame
+                Clip().batch_lookup(
+                    df=pd.DataFrame({
+                        "address": ["501 Auburn Avenue NE", "40 Pacifica"],
+                        "city": ["Atlanta", "Irvine"],
+                        "state": ["GA", "CA"],
+                        "zipCode": ["30312", "92618"],
+                    }),
+                    batch_size=10_000,
+                    workers=8,
+                    convert=True
+                )
+        '''
+        self._require_arrow(convert)
+
+        df = df[self._identifiable(df)]
+        chunks = [df.iloc[start:start + batch_size] for start in range(0, len(df), batch_size)]
+
+        # More workers than pooled connections would open and discard extra connections
+        workers = min(workers, POOL_MAXSIZE)
+
+        # Results are collected in submission order so the output rows follow the input rows
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._post_chunk, chunk) for chunk in chunks]
+            try:
+                payloads = [future.result() for future in futures]
+            except BaseException:
+                # Don't keep posting the remaining chunks once the batch has failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if convert:
+            # Keep only each chunk's records and build the result once, rather than concatenating a frame 
+            # per chunk, so the rows are copied a single time however many chunks there are
+            records = list(itertools.chain.from_iterable(payload['data'] for payload in payloads))
+            return self._to_arrow(records) if convert == "arrow" else self._to_frame(records, "batch")
+        else:
+            return payloads
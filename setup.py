@@ -1,5 +1,10 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+# Don't fail metadata-only builds when the README is not shipped alongside setup.py
+readme = Path(__file__).parent / "README.md"
+long_description = readme.read_text() if readme.exists() else ""
+
 setup(
     # Needed to silence warnings (and to be a worthwhile package)
     name="geospatial_tools",
@@ -10,7 +15,9 @@ setup(
     packages=find_packages(),
     
     # Needed for dependencies
-    install_requires=["requests", "pandas"],
+    install_requires=["requests>=2.28", "pandas>=2.0", "orjson>=3.9", "aiohttp>=3.9"],
+    extras_require={"brotli": ["brotli"], "arrow": ["pyarrow"]},
+    python_requires=">=3.9",
     
     # *strongly* suggested for sharing
     version="1.0.0",
@@ -18,5 +25,5 @@ setup(
     # The license can be anything you like
     license="MIT",
     description="An example of a Python package from pre-existing code",
-    long_description=open("README.md").read(),
+    long_description=long_description,
 )